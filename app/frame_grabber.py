@@ -19,6 +19,8 @@ class VideoFrameExtractor:
         """
         self.input_folder = input_folder
         self.output_folder = output_folder
+        # 最近一次 extract_frames 中處理失敗的影片
+        self.failed_videos = []
 
         # 確保資料夾存在，若不存在則自動建立
         os.makedirs(self.input_folder, exist_ok=True)
@@ -41,6 +43,7 @@ class VideoFrameExtractor:
             if os.path.isfile(os.path.join(self.input_folder, video_file)) and self._is_video_file(video_file)
         ]
 
+        self.failed_videos = []
         if use_multithreading:
             # 使用多線程處理多個影片檔案
             with ThreadPoolExecutor() as executor:
@@ -82,12 +85,14 @@ class VideoFrameExtractor:
         total_frames = self._get_total_frames(video_path)
         if total_frames is None:
             print(f"無法獲取 {video_path} 的總幀數，跳過處理。")
+            self._record_failure(video_path)
             return
 
         # 使用 ffprobe 獲取影片的 FPS
         fps = self._get_fps(video_path)
         if fps is None:
             print(f"無法獲取 {video_path} 的 FPS，跳過處理。")
+            self._record_failure(video_path)
             return
 
         video_name = os.path.splitext(os.path.basename(video_path))[0]
@@ -123,6 +128,10 @@ class VideoFrameExtractor:
 
         process = subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
         process.communicate()
+        if process.returncode != 0:
+            print(f"ffmpeg 處理 {video_path} 失敗，錯誤碼：{process.returncode}")
+            self._record_failure(video_path)
+            return
 
         # 重新命名輸出的幀檔案
         temp_files = sorted(
@@ -143,6 +152,15 @@ class VideoFrameExtractor:
 
         print(f"已提取 {video_path} 的幀。")
 
+    def _record_failure(self, video_path: str):
+        """
+        記錄處理失敗的影片，同一影片只記錄一次。
+
+        :param video_path: 影片檔案的路徑。
+        """
+        if video_path not in self.failed_videos:
+            self.failed_videos.append(video_path)
+
     def _parse_frame_info(self, info_file: str, fps: float) -> list:
         """
         解析幀資訊檔案以提取實際幀索引。
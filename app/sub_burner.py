@@ -1,6 +1,5 @@
 import subprocess
 import os
-from fontTools.ttLib import TTFont
 from tqdm import tqdm
 import sys  # 新增
 import glob
@@ -25,6 +24,8 @@ class SubtitleBurner:
         self.subtitle_folder = subtitle_folder
         self.output_folder = output_folder
         self.font_folder = font_folder
+        # 最近一次 burn_subtitles 中燒錄失敗的影片
+        self.failed_videos = []
 
         # 確保資料夾存在，若不存在則自動建立
         os.makedirs(self.original_videos_folder, exist_ok=True)
@@ -50,6 +51,8 @@ class SubtitleBurner:
         if not video_files:
             raise RuntimeError("資料夾中沒有找到任何符合條件的影片檔案。")
 
+        self.failed_videos = []
+
         with tqdm(video_files, file=sys.stdout) as progress_bar:  # 指定輸出流
             for video_file in progress_bar:
                 progress_bar.set_description(
@@ -88,6 +91,7 @@ class SubtitleBurner:
                     video_file, output_file, subtitle_file, use_gpu, stop_on_error, check_system_fonts, progress_bar)
         except Exception as e:
             print(f"❌ 發生錯誤：{e}")
+            self._record_failure(video_file)
             if stop_on_error:
                 raise
 
@@ -119,15 +123,18 @@ class SubtitleBurner:
 
         # 根據字幕檔案副檔名選擇濾鏡
         subtitle_ext = os.path.splitext(subtitle_file)[1].lower()
+        # 跳脫冒號（f-string 運算式中不可含反斜線，故先行處理）
+        escaped_subtitle_path = subtitle_path.replace(':', r'\:')
+        escaped_font_folder_path = font_folder_path.replace(':', r'\:')
         if subtitle_ext == ".ass":
-            filter_str = f"ass='{subtitle_path.replace(':', r'\:')}'"
+            filter_str = f"ass='{escaped_subtitle_path}'"
         elif subtitle_ext == ".srt":
-            filter_str = f"subtitles='{subtitle_path.replace(':', r'\:')}'"
+            filter_str = f"subtitles='{escaped_subtitle_path}'"
         else:
             raise ValueError(f"不支援的字幕格式：{subtitle_ext}")
 
         if not check_system_fonts and subtitle_ext == ".ass":
-            filter_str += f":fontsdir='{font_folder_path.replace(':', r'\:')}'"
+            filter_str += f":fontsdir='{escaped_font_folder_path}'"
 
         command = [
             "ffmpeg",
@@ -193,6 +200,7 @@ class SubtitleBurner:
 
         except Exception as e:
             print(f"\n❌ 發生錯誤：{e}")
+            self._record_failure(input_file)
             if stop_on_error:
                 raise
 
@@ -200,6 +208,15 @@ class SubtitleBurner:
         if not os.path.exists(output_path):
             raise RuntimeError(f"❌ 輸出檔案未生成：{output_path}")
 
+    def _record_failure(self, video_file: str):
+        """
+        記錄燒錄失敗的影片，同一影片只記錄一次。
+
+        :param video_file: 影片檔案的路徑。
+        """
+        if video_file not in self.failed_videos:
+            self.failed_videos.append(video_file)
+
     def _check_fonts_in_folder(self, subtitle_file: str):
         """
         檢查字體資料夾中是否包含字幕檔中提到的字體。
@@ -247,6 +264,9 @@ class SubtitleBurner:
         :param font_file: 字體檔案的路徑。
         :return: 字體名稱，若無法提取則回傳 None。
         """
+        # 延遲匯入 fontTools，僅在需要檢查字體時才載入
+        from fontTools.ttLib import TTFont
+
         try:
             font = TTFont(font_file)
             for record in font['name'].names:
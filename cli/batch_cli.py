@@ -0,0 +1,195 @@
+import argparse
+import csv
+import json
+import os
+
+from cli import frame_grabber_cli, sub_burner_cli
+
+
+def add_parser(subparsers):
+    """
+    註冊 `batch` 子指令，於同一個行程中依序執行清單檔內的多個工作。
+
+    :param subparsers: argparse 的子指令集合。
+    :return: 建立好的子指令解析器。
+    """
+    parser = subparsers.add_parser(
+        "batch", help="依照 JSON/CSV 清單檔批次執行 grab 與 burn 工作")
+    parser.add_argument("manifest", help="清單檔路徑（.json 或 .csv）")
+    parser.add_argument("--format", choices=["auto", "json", "csv"], default="auto",
+                        help="清單檔格式，預設依副檔名判斷")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="任一工作失敗時立即停止")
+    parser.set_defaults(func=run)
+    return parser
+
+
+def run(args):
+    """
+    執行清單檔中的所有工作。
+
+    :param args: 解析後的命令列參數。
+    :return: 全部成功時回傳 0，有工作失敗時回傳 1，清單檔無法讀取或含有無效工作時回傳 2。
+    """
+    try:
+        jobs = load_manifest(args.manifest, args.format)
+    except (OSError, ValueError, csv.Error) as e:
+        # json.JSONDecodeError 為 ValueError 的子類別
+        print(f"❌ 無法讀取清單檔：{e}")
+        return 2
+    parsers = _build_job_parsers()
+
+    # 先驗證所有工作，任何一個無效就不執行
+    all_job_args = []
+    invalid = 0
+    for index, job in enumerate(jobs, start=1):
+        try:
+            all_job_args.append(_build_job_args(job, parsers))
+        except ValueError as e:
+            invalid += 1
+            print(f"❌ 第 {index} 個工作無效：{e}")
+    if invalid:
+        print(f"清單檔中有 {invalid} 個無效的工作，未執行任何工作。")
+        return 2
+
+    succeeded = failed = 0
+    for index, job_args in enumerate(all_job_args, start=1):
+        try:
+            print(f"[{index}/{len(all_job_args)}] 執行 {job_args.command} 工作")
+            if job_args.func(job_args):
+                raise RuntimeError("部分影片處理失敗")
+            succeeded += 1
+        except Exception as e:
+            failed += 1
+            print(f"❌ 第 {index} 個工作失敗：{e}")
+            if args.fail_fast:
+                break
+
+    print(f"批次處理完成：成功 {succeeded} 個，失敗 {failed} 個。")
+    return 1 if failed else 0
+
+
+def load_manifest(manifest_path: str, manifest_format: str = "auto") -> list:
+    """
+    讀取清單檔並回傳工作列表。
+
+    JSON 可為工作物件的陣列，或包含 `jobs` 陣列的物件；CSV 需有標題列。
+    每個工作都必須包含 `command` 欄位（`grab` 或 `burn`）。
+
+    :param manifest_path: 清單檔路徑。
+    :param manifest_format: `auto`、`json` 或 `csv`。
+    :return: 工作字典的列表。
+    """
+    if manifest_format == "auto":
+        ext = os.path.splitext(manifest_path)[1].lower()
+        manifest_format = "csv" if ext == ".csv" else "json"
+
+    with open(manifest_path, "r", encoding="utf-8-sig", newline="") as f:
+        if manifest_format == "csv":
+            jobs = list(csv.DictReader(f))
+        else:
+            jobs = json.load(f)
+
+    if isinstance(jobs, dict):
+        jobs = jobs.get("jobs")
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        raise ValueError(f"清單檔格式錯誤，必須為工作物件的列表：{manifest_path}")
+    return jobs
+
+
+class _JobArgumentParser(argparse.ArgumentParser):
+    """
+    解析清單檔工作用的解析器，遇到錯誤時拋出 ValueError 而非結束程式。
+    """
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def _build_job_parsers() -> dict:
+    """
+    建立 grab/burn 工作的解析器，與 CLI 共用相同的參數定義與驗證。
+
+    :return: 子指令名稱與解析器的對照表。
+    """
+    job_parser = _JobArgumentParser(prog="batch-job")
+    # 子指令解析器會沿用 _JobArgumentParser 類別
+    job_subparsers = job_parser.add_subparsers(dest="command", required=True)
+    return {
+        "grab": frame_grabber_cli.add_parser(job_subparsers),
+        "burn": sub_burner_cli.add_parser(job_subparsers),
+    }
+
+
+def _build_job_args(job: dict, parsers: dict) -> argparse.Namespace:
+    """
+    將單一工作字典轉換為命令列參數，再交由該工作的解析器解析與驗證。
+
+    :param job: 工作字典。
+    :param parsers: 子指令名稱與解析器的對照表。
+    :return: 解析後的參數物件。
+    """
+    job = _normalize_keys(job)
+    command = str(job.pop("command", None) or "").strip()
+    if command not in parsers:
+        raise ValueError(f"未知的工作指令：{command!r}，請使用 'burn' 或 'grab'")
+
+    parser = parsers[command]
+    defaults = parser.parse_args([])
+    argv = []
+    for dest, value in job.items():
+        if dest in ("func", "command") or not hasattr(defaults, dest):
+            raise ValueError(f"{command} 工作不支援的參數：{dest}")
+        if value is None or value == "":
+            continue
+        if isinstance(value, (list, dict)):
+            raise ValueError(f"參數 {dest} 不可為列表或物件：{value!r}")
+
+        option = dest.replace("_", "-")
+        if isinstance(getattr(defaults, dest), bool):
+            argv.append(f"--{option}" if _to_bool(value) else f"--no-{option}")
+        elif isinstance(value, bool):
+            raise ValueError(f"參數 {dest} 不可為布林值：{value!r}")
+        else:
+            # 使用 --option=value 形式，避免以 - 開頭的值被視為選項
+            argv.append(f"--{option}={value}")
+
+    job_args = parser.parse_args(argv)
+    job_args.command = command
+    return job_args
+
+
+def _normalize_keys(job: dict) -> dict:
+    """
+    統一欄位名稱：去除前後空白，並將連字號轉為底線。
+
+    :param job: 工作字典。
+    :return: 欄位名稱統一後的新字典。
+    """
+    normalized = {}
+    for key, value in job.items():
+        if key is None:
+            raise ValueError("CSV 資料列的欄位數量超過標題列")
+        dest = str(key).strip().replace("-", "_")
+        if dest in normalized:
+            raise ValueError(f"重複的參數：{key}")
+        normalized[dest] = value
+    return normalized
+
+
+def _to_bool(value) -> bool:
+    """
+    將 JSON 或 CSV 中的布林值轉換為 bool。
+
+    :param value: 原始值。
+    :return: 轉換後的布林值。
+    """
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "y", "on"):
+        return True
+    if text in ("0", "false", "no", "n", "off"):
+        return False
+    raise ValueError(f"無法解析的布林值：{value!r}")
+
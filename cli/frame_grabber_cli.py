@@ -1,17 +1,64 @@
-from app.frame_grabber import VideoFrameExtractor
+import argparse
+import os
 
 
-def run():
-    # 設定參數
-    input_folder = "data/input/"
-    output_folder = "data/output/frames/"
-    frame_interval = 5
-    use_multithreading = True
-    use_gpu = True
+def positive_int(value) -> int:
+    """
+    將參數轉換為正整數，供 argparse 的 `type=` 使用。
 
-    extractor = VideoFrameExtractor(input_folder, output_folder)
+    :param value: 原始值。
+    :return: 轉換後的正整數。
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise argparse.ArgumentTypeError(f"必須為正整數：{value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"必須為正整數：{value!r}")
+    return number
+
+
+def add_parser(subparsers):
+    """
+    註冊 `grab` 子指令，參數對應 VideoFrameExtractor.extract_frames。
+
+    :param subparsers: argparse 的子指令集合。
+    :return: 建立好的子指令解析器。
+    """
+    parser = subparsers.add_parser("grab", help="從影片中提取幀")
+    parser.add_argument("--input-folder", default="data/input/",
+                        help="包含影片檔案的資料夾路徑")
+    parser.add_argument("--output-folder", default="data/output/frames/",
+                        help="儲存提取幀的資料夾路徑")
+    parser.add_argument("--frame-interval", type=positive_int, default=5,
+                        help="每隔多少幀提取一次")
+    parser.add_argument("--use-multithreading", action=argparse.BooleanOptionalAction, default=True,
+                        help="是否使用多線程處理多個影片")
+    parser.add_argument("--use-gpu", action=argparse.BooleanOptionalAction, default=True,
+                        help="是否使用 GPU 編解碼")
+    parser.set_defaults(func=run)
+    return parser
+
+
+def run(args):
+    """
+    執行擷取幀工作。
+
+    :param args: 解析後的命令列參數。
+    :return: 全部成功時回傳 0，有影片處理失敗時回傳 1。
+    """
+    # 延遲匯入，避免只查看說明或執行其他指令時載入後端
+    from app.frame_grabber import VideoFrameExtractor
+
+    extractor = VideoFrameExtractor(args.input_folder, args.output_folder)
     extractor.extract_frames(
-        frame_interval=frame_interval,
-        use_multithreading=use_multithreading,
-        use_gpu=use_gpu
+        frame_interval=args.frame_interval,
+        use_multithreading=args.use_multithreading,
+        use_gpu=args.use_gpu
     )
+
+    if extractor.failed_videos:
+        print(f"❌ {len(extractor.failed_videos)} 個影片擷取失敗：" +
+              ", ".join(os.path.basename(video) for video in extractor.failed_videos))
+        return 1
+    return 0
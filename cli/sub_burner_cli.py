@@ -1,21 +1,54 @@
-from app.sub_burner import SubtitleBurner
-
-
-def run():
-    # 設定參數
-    video_folder = "data/input/"
-    subtitle_folder = "data/subtitles/"
-    output_folder = "data/output/"
-    font_folder = "assets/fonts/"
-    use_gpu = True
-    stop_on_error = False
-    check_system_fonts = False
-
-    # 使用 SubtitleBurner 類別
-    burner = SubtitleBurner(video_folder, subtitle_folder,
-                            output_folder, font_folder)
+import argparse
+import os
+
+
+def add_parser(subparsers):
+    """
+    註冊 `burn` 子指令，參數對應 SubtitleBurner.burn_subtitles。
+
+    :param subparsers: argparse 的子指令集合。
+    :return: 建立好的子指令解析器。
+    """
+    parser = subparsers.add_parser("burn", help="將字幕燒錄到影片中")
+    parser.add_argument("--video-folder", default="data/input/",
+                        help="影片資料夾的路徑")
+    parser.add_argument("--subtitle-folder", default="data/subtitles/",
+                        help="字幕資料夾的路徑")
+    parser.add_argument("--output-folder", default="data/output/",
+                        help="輸出資料夾的路徑")
+    parser.add_argument("--font-folder", default="assets/fonts/",
+                        help="字體資料夾的路徑")
+    parser.add_argument("--use-gpu", action=argparse.BooleanOptionalAction, default=True,
+                        help="是否使用 GPU 編解碼")
+    parser.add_argument("--stop-on-error", action=argparse.BooleanOptionalAction, default=False,
+                        help="遇到錯誤時是否停止")
+    parser.add_argument("--check-system-fonts", action=argparse.BooleanOptionalAction, default=False,
+                        help="是否檢查系統中的字體")
+    parser.set_defaults(func=run)
+    return parser
+
+
+def run(args):
+    """
+    執行燒字幕工作。
+
+    :param args: 解析後的命令列參數。
+    :return: 全部成功時回傳 0，有影片燒錄失敗時回傳 1。
+    """
+    # 延遲匯入，避免只查看說明或執行其他指令時載入後端
+    from app.sub_burner import SubtitleBurner
+
+    burner = SubtitleBurner(args.video_folder, args.subtitle_folder,
+                            args.output_folder, args.font_folder)
     burner.burn_subtitles(
-        use_gpu=use_gpu,
-        stop_on_error=stop_on_error,
-        check_system_fonts=check_system_fonts
+        use_gpu=args.use_gpu,
+        stop_on_error=args.stop_on_error,
+        check_system_fonts=args.check_system_fonts
     )
+
+    # stop_on_error 為 False 時錯誤不會拋出，改以回傳值反映失敗
+    if burner.failed_videos:
+        print(f"❌ {len(burner.failed_videos)} 個影片燒錄失敗：" +
+              ", ".join(os.path.basename(video) for video in burner.failed_videos))
+        return 1
+    return 0
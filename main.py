@@ -1,17 +1,26 @@
 import sys
 
 
+def build_cli_parser():
+    """
+    建立 CLI 的參數解析器，各子指令的後端僅在執行時才會匯入。
+    """
+    import argparse
+    from cli import batch_cli, frame_grabber_cli, sub_burner_cli
+
+    parser = argparse.ArgumentParser(
+        prog="python main.py cli", description="Every XX Frame in Order 命令列介面")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sub_burner_cli.add_parser(subparsers)
+    frame_grabber_cli.add_parser(subparsers)
+    batch_cli.add_parser(subparsers)
+    return parser
+
+
 def main():
     if len(sys.argv) > 1 and sys.argv[1] == "cli":
-        from cli.sub_burner_cli import run as sub_burner_cli
-        from cli.frame_grabber_cli import run as frame_grabber_cli
-
-        if sys.argv[2] == "burn":
-            sub_burner_cli()
-        elif sys.argv[2] == "grab":
-            frame_grabber_cli()
-        else:
-            print("未知的 CLI 指令，請使用 'burn' 或 'grab'")
+        args = build_cli_parser().parse_args(sys.argv[2:])
+        sys.exit(args.func(args))
     else:
         from flask import Flask, render_template, request, jsonify
         from app.sub_burner import SubtitleBurner
@@ -0,0 +1,184 @@
+import argparse
+import json
+
+import pytest
+
+from cli import batch_cli, frame_grabber_cli, sub_burner_cli
+
+
+@pytest.fixture
+def parsers():
+    return batch_cli._build_job_parsers()
+
+
+def _write(path, text, encoding="utf-8"):
+    path.write_text(text, encoding=encoding)
+    return str(path)
+
+
+def test_load_manifest_json_list(tmp_path):
+    jobs = [{"command": "grab", "frame_interval": 3}]
+    path = _write(tmp_path / "jobs.json", json.dumps(jobs))
+    assert batch_cli.load_manifest(path) == jobs
+
+
+def test_load_manifest_json_jobs_wrapper(tmp_path):
+    jobs = [{"command": "burn"}, {"command": "grab"}]
+    path = _write(tmp_path / "jobs.json", json.dumps({"jobs": jobs}))
+    assert batch_cli.load_manifest(path) == jobs
+
+
+def test_load_manifest_csv_with_header(tmp_path):
+    path = _write(tmp_path / "jobs.csv",
+                  "command,input_folder,frame_interval\ngrab,in/,10\n")
+    assert batch_cli.load_manifest(path) == [
+        {"command": "grab", "input_folder": "in/", "frame_interval": "10"}]
+
+
+def test_load_manifest_csv_with_bom(tmp_path):
+    path = _write(tmp_path / "jobs.csv", "command,use_gpu\ngrab,false\n",
+                  encoding="utf-8-sig")
+    assert batch_cli.load_manifest(path) == [
+        {"command": "grab", "use_gpu": "false"}]
+
+
+def test_load_manifest_explicit_format(tmp_path):
+    path = _write(tmp_path / "jobs.txt", "command\nburn\n")
+    assert batch_cli.load_manifest(path, "csv") == [{"command": "burn"}]
+
+
+@pytest.mark.parametrize("content", ['{"command": "grab"}', '[1, 2]', '{"jobs": "grab"}'])
+def test_load_manifest_rejects_bad_structure(tmp_path, content):
+    path = _write(tmp_path / "jobs.json", content)
+    with pytest.raises(ValueError):
+        batch_cli.load_manifest(path)
+
+
+def test_build_job_args_uses_defaults(parsers):
+    job_args = batch_cli._build_job_args({"command": "grab"}, parsers)
+    assert job_args.command == "grab"
+    assert job_args.input_folder == "data/input/"
+    assert job_args.frame_interval == 5
+    assert job_args.use_gpu is True
+
+
+def test_build_job_args_coerces_csv_strings(parsers):
+    job_args = batch_cli._build_job_args(
+        {"command": "grab", "frame-interval": "10", "use_gpu": "no",
+         "use_multithreading": "1", "output_folder": ""}, parsers)
+    assert job_args.frame_interval == 10
+    assert job_args.use_gpu is False
+    assert job_args.use_multithreading is True
+    assert job_args.output_folder == "data/output/frames/"
+
+
+@pytest.mark.parametrize("job", [
+    {},
+    {"command": "nope"},
+    {"command": "grab", "typo": "x"},
+    {"command": "grab", "typo": ""},
+    {"command": "grab", "func": "x"},
+    {"command": "grab", "use_gpu": "maybe"},
+    {"command": "grab", "frame_interval": 0},
+    {"command": "grab", "frame_interval": "-3"},
+    {"command": "grab", "frame_interval": 2.9},
+    {"command": "grab", "frame_interval": True},
+    {"command": "grab", "frame_interval": 2.0},
+    {"command": "grab", "input_folder": ["x", 1]},
+    {"command": "grab", "output_folder": {"a": 1}},
+    {"command": "grab", "input_folder": True},
+    {"command": "grab", "frame_interval": "abc"},
+    {"command": "burn", "frame_interval": 5},
+    {"command": "grab", None: ["extra"]},
+])
+def test_build_job_args_rejects_bad_values(parsers, job):
+    with pytest.raises(ValueError):
+        batch_cli._build_job_args(job, parsers)
+
+
+def test_build_job_args_normalizes_keys(parsers):
+    job_args = batch_cli._build_job_args(
+        {" command ": "grab", " input-folder": "in/"}, parsers)
+    assert job_args.command == "grab"
+    assert job_args.input_folder == "in/"
+
+
+def test_build_job_args_rejects_duplicate_keys(parsers):
+    with pytest.raises(ValueError):
+        batch_cli._build_job_args(
+            {"command": "grab", "input_folder": "a/", "input-folder": "b/"}, parsers)
+
+
+@pytest.fixture
+def stub_jobs(monkeypatch):
+    """以假的 run 取代 grab/burn 後端，回傳呼叫紀錄。"""
+    calls = []
+
+    def fake_run(args):
+        calls.append(args.command)
+        if args.input_folder == "raise/":
+            raise RuntimeError("boom")
+        return 1 if args.input_folder == "fail/" else 0
+
+    monkeypatch.setattr(frame_grabber_cli, "run", fake_run)
+    monkeypatch.setattr(sub_burner_cli, "run",
+                        lambda args: calls.append(args.command))
+    return calls
+
+
+def _run_batch(tmp_path, jobs, fail_fast=False):
+    path = _write(tmp_path / "jobs.json", json.dumps(jobs))
+    args = argparse.Namespace(manifest=path, format="auto", fail_fast=fail_fast)
+    return batch_cli.run(args)
+
+
+def test_run_all_jobs_succeed(tmp_path, stub_jobs, capsys):
+    code = _run_batch(tmp_path, [{"command": "grab"}, {"command": "burn"}])
+    assert code == 0
+    assert stub_jobs == ["grab", "burn"]
+    assert "成功 2 個，失敗 0 個" in capsys.readouterr().out
+
+
+def test_run_counts_failed_and_raising_jobs(tmp_path, stub_jobs, capsys):
+    code = _run_batch(tmp_path, [
+        {"command": "grab", "input_folder": "fail/"},
+        {"command": "grab", "input_folder": "raise/"},
+        {"command": "burn"},
+    ])
+    assert code == 1
+    assert stub_jobs == ["grab", "grab", "burn"]
+    assert "成功 1 個，失敗 2 個" in capsys.readouterr().out
+
+
+def test_run_fail_fast_stops_after_first_failure(tmp_path, stub_jobs, capsys):
+    code = _run_batch(tmp_path, [
+        {"command": "grab", "input_folder": "fail/"},
+        {"command": "burn"},
+    ], fail_fast=True)
+    assert code == 1
+    assert stub_jobs == ["grab"]
+    assert "成功 0 個，失敗 1 個" in capsys.readouterr().out
+
+
+def test_run_invalid_job_runs_nothing(tmp_path, stub_jobs, capsys):
+    code = _run_batch(tmp_path, [
+        {"command": "grab"},
+        {"command": "grab", "typo": 1},
+        {"command": "nope"},
+    ])
+    out = capsys.readouterr().out
+    assert code == 2
+    assert stub_jobs == []
+    assert "第 2 個工作無效" in out
+    assert "第 3 個工作無效" in out
+
+
+@pytest.mark.parametrize("content", [None, '[{"command":', '{"command": "grab"}'])
+def test_run_reports_unreadable_manifest(tmp_path, stub_jobs, capsys, content):
+    path = tmp_path / "jobs.json"
+    if content is not None:
+        path.write_text(content, encoding="utf-8")
+    args = argparse.Namespace(manifest=str(path), format="auto", fail_fast=False)
+    assert batch_cli.run(args) == 2
+    assert stub_jobs == []
+    assert capsys.readouterr().out.startswith("❌ 無法讀取清單檔：")
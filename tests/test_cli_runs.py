@@ -0,0 +1,72 @@
+import argparse
+
+import pytest
+
+# 後端模組在匯入時需要 tqdm
+pytest.importorskip("tqdm")
+
+from app.frame_grabber import VideoFrameExtractor  # noqa: E402
+from app.sub_burner import SubtitleBurner  # noqa: E402
+from cli import frame_grabber_cli, sub_burner_cli  # noqa: E402
+
+
+def _burn_args(tmp_path):
+    return argparse.Namespace(
+        video_folder=str(tmp_path / "videos"),
+        subtitle_folder=str(tmp_path / "subtitles"),
+        output_folder=str(tmp_path / "output"),
+        font_folder=str(tmp_path / "fonts"),
+        use_gpu=False, stop_on_error=False, check_system_fonts=False)
+
+
+def _grab_args(tmp_path):
+    return argparse.Namespace(
+        input_folder=str(tmp_path / "input"),
+        output_folder=str(tmp_path / "frames"),
+        frame_interval=5, use_multithreading=False, use_gpu=False)
+
+
+def test_subtitle_burner_records_each_failure_once(tmp_path):
+    args = _burn_args(tmp_path)
+    burner = SubtitleBurner(args.video_folder, args.subtitle_folder,
+                            args.output_folder, args.font_folder)
+    burner._record_failure("a.mp4")
+    burner._record_failure("a.mp4")
+    burner._record_failure("b.mp4")
+    assert burner.failed_videos == ["a.mp4", "b.mp4"]
+
+
+def test_sub_burner_run_returns_1_on_failed_videos(tmp_path, monkeypatch, capsys):
+    def fake_burn(self, **kwargs):
+        self._record_failure("videos/a.mp4")
+        self._record_failure("videos/a.mp4")
+
+    monkeypatch.setattr(SubtitleBurner, "burn_subtitles", fake_burn)
+    assert sub_burner_cli.run(_burn_args(tmp_path)) == 1
+    assert "1 個影片燒錄失敗：a.mp4" in capsys.readouterr().out
+
+
+def test_sub_burner_run_returns_0_on_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(SubtitleBurner, "burn_subtitles",
+                        lambda self, **kwargs: None)
+    assert sub_burner_cli.run(_burn_args(tmp_path)) == 0
+
+
+def test_frame_grabber_run_returns_1_on_failed_videos(tmp_path, monkeypatch, capsys):
+    def fake_process(self, video_path, frame_interval, use_gpu):
+        self._record_failure(video_path)
+        self._record_failure(video_path)
+
+    (tmp_path / "input").mkdir()
+    (tmp_path / "input" / "a.mp4").touch()
+    monkeypatch.setattr(VideoFrameExtractor, "_process_video", fake_process)
+    assert frame_grabber_cli.run(_grab_args(tmp_path)) == 1
+    assert "1 個影片擷取失敗：a.mp4" in capsys.readouterr().out
+
+
+def test_frame_grabber_run_returns_0_on_success(tmp_path, monkeypatch):
+    (tmp_path / "input").mkdir()
+    (tmp_path / "input" / "a.mp4").touch()
+    monkeypatch.setattr(VideoFrameExtractor, "_process_video",
+                        lambda self, *args: None)
+    assert frame_grabber_cli.run(_grab_args(tmp_path)) == 0
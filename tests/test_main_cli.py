@@ -0,0 +1,78 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["fontTools", "flask", "waitress", "tqdm",
+                 "app.frame_grabber", "app.sub_burner"]
+
+
+def _run_python(code, *args):
+    return subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+
+
+def _loaded_heavy_modules(code):
+    # 在獨立行程中執行，確保 sys.modules 不受其他測試影響
+    result = _run_python(code + f"""
+import json, sys
+print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))
+""")
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cli_without_subcommand_prints_usage():
+    result = subprocess.run(
+        [sys.executable, "main.py", "cli"],
+        cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 2
+    assert "usage:" in result.stderr
+
+
+def test_cli_rejects_unknown_subcommand():
+    result = subprocess.run(
+        [sys.executable, "main.py", "cli", "nope"],
+        cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 2
+    assert "invalid choice" in result.stderr
+
+
+def test_cli_rejects_non_positive_frame_interval():
+    result = subprocess.run(
+        [sys.executable, "main.py", "cli", "grab", "--frame-interval", "0"],
+        cwd=ROOT, capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 2
+    assert "--frame-interval" in result.stderr
+
+
+def test_build_cli_parser_parses_options():
+    result = _run_python("""
+import main
+args = main.build_cli_parser().parse_args(
+    ["grab", "--input-folder", "in/", "--frame-interval", "3", "--no-use-gpu"])
+print(args.command, args.input_folder, args.frame_interval, args.use_gpu)
+""")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["grab", "in/", "3", "False"]
+
+
+def test_build_cli_parser_does_not_import_heavy_modules():
+    assert _loaded_heavy_modules("""
+import main
+main.build_cli_parser()
+""") == []
+
+
+def test_grab_help_does_not_import_heavy_modules():
+    assert _loaded_heavy_modules("""
+import sys
+import main
+sys.argv = ["main.py", "cli", "grab", "--help"]
+try:
+    main.main()
+except SystemExit as e:
+    assert e.code == 0
+""") == []